@@ -53,8 +53,7 @@ ITALIAN_BLACKLIST = ["RAI ITALIA", "STAR CRIME", "SKYSHOWTIME 1", "SKY SPORT FOO
 
 def normalize_italian_name(name):
     n = name.upper().strip()
-    for old, new in ITALIAN_RENAMES.items():
-        if n == old.upper(): return new
+    if n in ITALIAN_RENAMES: return ITALIAN_RENAMES[n]
     n = re.sub(r"\[.*?\]", "", n)
     n = re.sub(r"\(.*?\)", "", n)
     n = re.sub(r"\s+(HD|FHD|SD|4K|ITA|ITALIA|BACKUP|TIMVISION|PLUS)$", "", n)
@@ -66,8 +65,7 @@ def normalize_italian_name(name):
 
 def get_channel_priority(name):
     upper = name.upper()
-    for ch, prio in TIVUSAT_ORDER.items():
-        if upper == ch: return prio
+    if upper in TIVUSAT_ORDER: return TIVUSAT_ORDER[upper]
     for ch, prio in TIVUSAT_ORDER.items():
         if ch in upper: return prio
     if "SKY" in upper: return 200
@@ -5,20 +5,22 @@
 if __name__ == "__main__":
 	from vavoo.utils import *
 	from vavoo import vjackson, stalker, vavoo_tv, vjlive
+	from functools import partial
 	params = dict(parse_qsl(sys.argv[2][1:]))
 	tv = params.get("name")
 	action = params.pop("action", None)
 	actions = {
-		"choose": lambda: vavoo_tv.choose(),
-		"get_genres": lambda: stalker.get_genres(),
-		"choose_portal": lambda: stalker.choose_portal(),
-		"new_mac": lambda: stalker.new_mac(),
-		"clear": lambda: clear(),
-		"delete_search": lambda: delete_search(params),
-		"channels": lambda: vjlive.channels(params.get('items'), params.get('type'), params.get('group')),
-		"settings": lambda: openSettings(sys.argv[1]),
-		"favchannels": lambda: vjlive.favchannels(),
-		"makem3u": lambda: vjlive.makem3u()
+		"choose": vavoo_tv.choose,
+		"get_genres": stalker.get_genres,
+		"choose_portal": stalker.choose_portal,
+		"new_mac": stalker.new_mac,
+		"clear": clear,
+		"delete_search": partial(delete_search, params),
+		"channels": partial(vjlive.channels, params.get('items'), params.get('type'), params.get('group')),
+		"settings": partial(openSettings, sys.argv[1]),
+		"favchannels": vjlive.favchannels,
+		"delallTvFavorit": vjlive.clear_favorits,
+		"makem3u": vjlive.makem3u
 	}
 	if tv:
 		if action == "addTvFavorit": vjlive.change_favorit(tv)
@@ -26,9 +28,6 @@ if __name__ == "__main__":
 		else: vjlive.livePlay(tv, params.get('type'), params.get('group'))
 	elif action is None:
 		vjackson.menu(params)
-	elif action == "delallTvFavorit":
-		setSetting("favs", "[]")
-		execute('Container.Refresh')
 	elif action in actions:
 		actions[action]()
 	else:
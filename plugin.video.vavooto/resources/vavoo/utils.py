@@ -139,8 +139,10 @@ def selectDialog(list, heading=None, multiselect = False, preselect=False):
 def set_cache(key, value, timeout=False):
 	path = convertPluginParams(key)
 	data = json.dumps({"sigValidUntil": False if timeout == False else int(time.time()) + (timeout * 3600), "value": value})
-	home.setProperty(path, data)
 	file_path = os.path.join(cachepath, path)
+	# unveränderter Wert: Disk-Write überspringen
+	if home.getProperty(path) == data and os.path.isfile(file_path): return
+	home.setProperty(path, data)
 	temp_path = None
 	if addon.getSetting("comp") == "true":
 		payload = compress(data.encode())
@@ -574,6 +576,11 @@ def end(succeeded=True, cacheToDisc=True):
 def add(params, o, isFolder=False):
 	return xbmcplugin.addDirectoryItem(int(sys.argv[1]), url_for(params), o, isFolder)
 
+def add_many(entries, isFolder=False):
+	# entries: [(params, ListItem), ...] -> ein einziger addDirectoryItems-Aufruf
+	items = [(url_for(params), o, isFolder) for params, o in entries]
+	return xbmcplugin.addDirectoryItems(int(sys.argv[1]), items, len(items))
+
 def set_category(cat):
 	xbmcplugin.setPluginCategory(int(sys.argv[1]), cat)
 
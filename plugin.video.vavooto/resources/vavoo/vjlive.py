@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from vavoo.utils import *
 
-chanicons = ['13thstreet.png', '3sat.png', 'animalplanet.png', 'anixe.png', 'ard.png', 'ardalpha.png', 'arte.png', 'atv.png', 'atv2.png', 'automotorsport.png', 'axnblack.png', 'axnwhite.png', 'br.png', 'cartoonito.png', 'cartoonnetwork.png', 'comedycentral.png', 'curiositychannel.png', 'fix&foxi.png', 'dazn1.png', 'dazn2.png', 'deluxemusic.png', 'nationalgeographic.png', 'dmax.png', 'eurosport1.png', 'eurosport2.png', 'nickjunior.png', 'superrtl.png', 'heimatkanal.png', 'history.png', 'hr.png', 'jukebox.png', 'kabel1doku.png', 'pro7.png', 'pro7maxx.png', 'pro7fun.png', 'rtl2.png', 'kika.png', 'kinowelt.png', 'mdr.png', 'universaltv.png', 'discovery.png', 'mtv.png', 'n24doku.png', 'natgeowild.png', 'sky1.png', 'ndr.png', 'nickelodeon.png', 'nitro.png', 'romancetv.png', 'ntv.png', 'one.png', 'orf1.png', 'orf2.png', 'orf3.png', 'orfsportplus.png', 'phoenix.png', 'geotv.png', 'puls24.png', 'puls4.png', 'rbb.png', 'ric.png', 'motorvision.png', 'rtl.png', 'rtlcrime.png', 'rtlliving.png', 'kabel1.png', 'rtlpassion.png', 'rtlup.png', 'sat1.png', 'sat1emotions.png', 'sat1gold.png', 'servustv.png', 'silverline.png', 'sixx.png', 'skyatlantic.png', 'skycinemaaction.png', 'skycinemaclassics.png', 'skycinemafamily.png', 'skycinemahighlights.png', 'skycinemapremieren.png', 'skycrime.png', 'skydocumentaries.png', 'skykrimi.png', 'skynature.png', 'skyreplay.png', 'skyshowcase.png', 'spiegelgeschichte.png', 'kabel1classics.png', 'sport1.png', 'sportdigital.png', 'swr.png', 'syfy.png', 'tagesschau24.png', 'tele5.png', 'tlc.png', 'toggoplus.png', 'crime+investigation.png', 'vox.png', 'voxup.png', 'warnertvcomedy.png', 'warnertvfilm.png', 'warnertvserie.png', 'wdr.png', 'welt.png', 'weltderwunder.png', 'zdf.png', 'zdfinfo.png', 'zdfneo.png', 'zeeone.png', 'skycinemathriller.png']
+chanicons = {'13thstreet.png', '3sat.png', 'animalplanet.png', 'anixe.png', 'ard.png', 'ardalpha.png', 'arte.png', 'atv.png', 'atv2.png', 'automotorsport.png', 'axnblack.png', 'axnwhite.png', 'br.png', 'cartoonito.png', 'cartoonnetwork.png', 'comedycentral.png', 'curiositychannel.png', 'fix&foxi.png', 'dazn1.png', 'dazn2.png', 'deluxemusic.png', 'nationalgeographic.png', 'dmax.png', 'eurosport1.png', 'eurosport2.png', 'nickjunior.png', 'superrtl.png', 'heimatkanal.png', 'history.png', 'hr.png', 'jukebox.png', 'kabel1doku.png', 'pro7.png', 'pro7maxx.png', 'pro7fun.png', 'rtl2.png', 'kika.png', 'kinowelt.png', 'mdr.png', 'universaltv.png', 'discovery.png', 'mtv.png', 'n24doku.png', 'natgeowild.png', 'sky1.png', 'ndr.png', 'nickelodeon.png', 'nitro.png', 'romancetv.png', 'ntv.png', 'one.png', 'orf1.png', 'orf2.png', 'orf3.png', 'orfsportplus.png', 'phoenix.png', 'geotv.png', 'puls24.png', 'puls4.png', 'rbb.png', 'ric.png', 'motorvision.png', 'rtl.png', 'rtlcrime.png', 'rtlliving.png', 'kabel1.png', 'rtlpassion.png', 'rtlup.png', 'sat1.png', 'sat1emotions.png', 'sat1gold.png', 'servustv.png', 'silverline.png', 'sixx.png', 'skyatlantic.png', 'skycinemaaction.png', 'skycinemaclassics.png', 'skycinemafamily.png', 'skycinemahighlights.png', 'skycinemapremieren.png', 'skycrime.png', 'skydocumentaries.png', 'skykrimi.png', 'skynature.png', 'skyreplay.png', 'skyshowcase.png', 'spiegelgeschichte.png', 'kabel1classics.png', 'sport1.png', 'sportdigital.png', 'swr.png', 'syfy.png', 'tagesschau24.png', 'tele5.png', 'tlc.png', 'toggoplus.png', 'crime+investigation.png', 'vox.png', 'voxup.png', 'warnertvcomedy.png', 'warnertvfilm.png', 'warnertvserie.png', 'wdr.png', 'welt.png', 'weltderwunder.png', 'zdf.png', 'zdfinfo.png', 'zdfneo.png', 'zeeone.png', 'skycinemathriller.png'}
 
 def resolve_link(link):
 	if not "vavoo" in link:
@@ -221,8 +221,7 @@ ITALIAN_BLACKLIST = ["RAI ITALIA", "STAR CRIME", "SKYSHOWTIME 1", "SKY SPORT FOO
 
 def normalize_italian_name(name):
 	n = name.upper().strip()
-	for old, new in ITALIAN_RENAMES.items():
-		if n == old.upper(): return new
+	if n in ITALIAN_RENAMES: return ITALIAN_RENAMES[n]
 	n = re.sub(r"\[.*?\]", "", n)
 	n = re.sub(r"\(.*?\)", "", n)
 	n = re.sub(r"\s+(HD|FHD|SD|4K|ITA|ITALIA|BACKUP|TIMVISION|PLUS)$", "", n)
@@ -234,8 +233,7 @@ def normalize_italian_name(name):
 
 def get_channel_priority(name):
 	upper = name.upper()
-	for ch, prio in TIVUSAT_ORDER.items():
-		if upper == ch: return prio
+	if upper in TIVUSAT_ORDER: return TIVUSAT_ORDER[upper]
 	for ch, prio in TIVUSAT_ORDER.items():
 		if ch in upper: return prio
 	if "SKY" in upper: return 200
@@ -327,13 +325,12 @@ def channels(items=None, type=None, group=None):
 	except (TypeError, ValueError):
 		lines = []
 	results = json.loads(items) if items else getchannels(type, group)
+	entries = []
 	for name in results:
 		index = len(results[name])
 		title = name if getSetting("stream_count") == "false" or index == 1 else "%s  (%s)" % (name, index)
 		o = ListItem(name)
-		img = "%s.png" % name.replace(" ", "").lower()
-		iconimage = "DefaultTVShows.png"
-		if img in chanicons: iconimage = "https://michaz1988.github.io/logos/%s" % img
+		iconimage = get_channel_logo(name) or "DefaultTVShows.png"
 		o.setArt({"icon": iconimage, "thumb": iconimage, "poster": iconimage})
 		cm = []
 		if not name in lines:
@@ -350,7 +347,8 @@ def channels(items=None, type=None, group=None):
 		info_tag.set_info(infoLabels)
 		o.setProperty("IsPlayable", "true")
 		param = {"name": name, "type": type, "group": group} if type else {"name": name}
-		add(param, o)
+		entries.append((param, o))
+	add_many(entries)
 	sort_method()
 	end()
 
@@ -358,12 +356,11 @@ def favchannels():
 	try: lines = json.loads(getSetting("favs"))
 	except (TypeError, ValueError):
 		return
+	entries = []
 	for name in getchannels():
 		if not name in lines: continue
 		o = ListItem(name)
-		img = "%s.png" % name.replace(" ", "").lower()
-		iconimage = "DefaultTVShows.png"
-		if img in chanicons: iconimage = "https://michaz1988.github.io/logos/%s" % img
+		iconimage = get_channel_logo(name) or "DefaultTVShows.png"
 		o.setArt({"icon": iconimage, "thumb": iconimage, "poster": iconimage})
 		cm = []
 		cm.append(("von TV Favoriten entfernen", "RunPlugin(%s?action=delTvFavorit&name=%s)" % (sys.argv[0], name.replace("&", "%26").replace("+", "%2b"))))
@@ -373,7 +370,8 @@ def favchannels():
 		info_tag = ListItemInfoTag(o, 'video')
 		info_tag.set_info(infoLabels)
 		o.setProperty("IsPlayable", "true")
-		add({"name": name}, o)
+		entries.append(({"name": name}, o))
+	add_many(entries)
 	sort_method()
 	end()
 
@@ -390,3 +388,7 @@ def change_favorit(name, delete=False):
 	setSetting("favs", json.dumps(lines))
 	if len(lines) == 0: execute("Action(ParentDir)")
 	else: execute("Container.Refresh")
+
+def clear_favorits():
+	setSetting("favs", "[]")
+	execute("Container.Refresh")
@@ -2,6 +2,7 @@ import os
 import sys
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
@@ -36,14 +37,20 @@ def main():
         gen._catchup_cfg["enabled"] = True
         gen._catchup_cfg["days"] = args.catchup_days
     
-    if not gen.generate_m3u8(args.output, groups=args.groups):
-        logging.error("Failed to generate playlist.")
-        success = False
-
-    if args.epg_output:
-        logging.info(f"Starting EPG merge...")
-        from src.epg_merger import merge_epg
-        if not merge_epg(args.epg_output):
+    # The EPG merge only depends on config.json, so it runs alongside
+    # playlist generation instead of after it.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        epg_future = None
+        if args.epg_output:
+            logging.info(f"Starting EPG merge...")
+            from src.epg_merger import merge_epg
+            epg_future = executor.submit(merge_epg, args.epg_output)
+
+        if not gen.generate_m3u8(args.output, groups=args.groups):
+            logging.error("Failed to generate playlist.")
+            success = False
+
+        if epg_future is not None and not epg_future.result():
             logging.error("Failed to merge EPG.")
             success = False
 
@@ -16,7 +16,7 @@ import argparse
 # Add the root directory to sys.path to allow imports from src
 sys.path.append(os.path.join(os.path.dirname(__file__)))
 
-from src.playlist_generator import PlaylistGenerator
+from src.playlist_generator import PlaylistGenerator, DEFAULT_NETWORK_CACHING_MS
 
 # Configure logging
 logging.basicConfig(
@@ -45,7 +45,8 @@ def encode_url_for_proxy(url):
     return base64.urlsafe_b64encode(url.encode('utf-8')).decode('utf-8')
 
 
-def generate_proxy_playlist(output_path="playlist_proxy.m3u8", groups=None, proxy_url=None):
+def generate_proxy_playlist(output_path="playlist_proxy.m3u8", groups=None, proxy_url=None,
+                            network_caching=DEFAULT_NETWORK_CACHING_MS):
     """
     Generate a playlist with proxy URLs instead of direct Vavoo URLs.
     
@@ -53,6 +54,7 @@ def generate_proxy_playlist(output_path="playlist_proxy.m3u8", groups=None, prox
         output_path: Path to save the playlist
         groups: List of groups to include
         proxy_url: Full URL of the proxy server (e.g., http://localhost:5000 or https://vavoo-proxy.onrender.com)
+        network_caching: VLC network-caching value in ms written for each channel
     
     Returns:
         True if successful, False otherwise
@@ -105,7 +107,7 @@ def generate_proxy_playlist(output_path="playlist_proxy.m3u8", groups=None, prox
                 # Write VLC options for better compatibility
                 f.write(f'#EXTVLCOPT:http-user-agent=okhttp/4.11.0\n')
                 f.write(f'#EXTVLCOPT:http-reconnect=true\n')
-                f.write(f'#EXTVLCOPT:network-caching=3000\n')
+                f.write(f'#EXTVLCOPT:network-caching={network_caching}\n')
                 
                 # Write channel info
                 header = f'#EXTINF:-1 tvg-id="{ch.tvg_id}" tvg-name="{ch.clean_name}" tvg-logo="{ch.logo_override or ch.logo}" channel="{ch.tvg_id}" group-title="{ch.group}",{ch.clean_name}'
@@ -132,6 +134,8 @@ def main():
     parser.add_argument("--groups", nargs="+", default=["Italy"], help="Groups to include (default: Italy)")
     parser.add_argument("--proxy-url", default=None, help=f"Proxy server URL (default: {DEFAULT_REMOTE_PROXY})")
     parser.add_argument("--local", action="store_true", help="Use local proxy (http://localhost:5000)")
+    parser.add_argument("--network-caching", type=int, default=DEFAULT_NETWORK_CACHING_MS,
+                        help=f"VLC network-caching in ms (default: {DEFAULT_NETWORK_CACHING_MS})")
     
     args = parser.parse_args()
     
@@ -143,7 +147,8 @@ def main():
     success = generate_proxy_playlist(
         output_path=args.output,
         groups=args.groups,
-        proxy_url=proxy_url
+        proxy_url=proxy_url,
+        network_caching=args.network_caching
     )
     
     sys.exit(0 if success else 1)
@@ -18,7 +18,7 @@ import argparse
 # Add the root directory to sys.path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
-from src.playlist_generator import PlaylistGenerator
+from src.playlist_generator import PlaylistGenerator, DEFAULT_NETWORK_CACHING_MS
 
 # Configure logging
 logging.basicConfig(
@@ -31,7 +31,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def generate_streamlink_playlist(output_path="playlist_streamlink.m3u8", groups=None):
+def generate_streamlink_playlist(output_path="playlist_streamlink.m3u8", groups=None,
+                                 network_caching=DEFAULT_NETWORK_CACHING_MS):
     """
     Generate a playlist for use with Streamlink.
     
@@ -41,6 +42,7 @@ def generate_streamlink_playlist(output_path="playlist_streamlink.m3u8", groups=
     Args:
         output_path: Path to save the playlist
         groups: List of groups to include
+        network_caching: VLC network-caching value in ms written for each channel
     
     Returns:
         True if successful, False otherwise
@@ -81,6 +83,7 @@ def generate_streamlink_playlist(output_path="playlist_streamlink.m3u8", groups=
         # Process channels
         processed_channels = []
         logos_dir = os.path.join(os.path.dirname(__file__), "..", "logos")
+        logos_cache = gen._build_logos_cache(logos_dir)
         
         for ch in channels:
             norm_name = gen._normalize_name(ch['name'])
@@ -120,12 +123,7 @@ def generate_streamlink_playlist(output_path="playlist_streamlink.m3u8", groups=
             # Check local logo
             logo_path = ch.get('logo', '')
             if epg_id:
-                target_fname = f"{epg_id}.png".lower()
-                matched_file = None
-                for f in os.listdir(logos_dir):
-                    if f.lower() == target_fname:
-                        matched_file = f
-                        break
+                matched_file = logos_cache.get(f"{epg_id}.png".lower())
                 if matched_file:
                     logo_path = f"https://raw.githubusercontent.com/mich-de/vavoo-player/master/logos/{matched_file}"
             
@@ -160,7 +158,7 @@ def generate_streamlink_playlist(output_path="playlist_streamlink.m3u8", groups=
                 f.write(f'#EXTVLCOPT:http-user-agent=okhttp/4.11.0\n')
                 f.write(f'#EXTVLCOPT:http-header=mediahubmx-signature={sig}\n')
                 f.write(f'#EXTVLCOPT:http-reconnect=true\n')
-                f.write(f'#EXTVLCOPT:network-caching=3000\n')
+                f.write(f'#EXTVLCOPT:network-caching={network_caching}\n')
                 
                 # Write channel info
                 header = f'#EXTINF:-1 tvg-id="{ch["tvg_id"]}" tvg-name="{ch["clean_name"]}" tvg-logo="{ch["final_logo"]}" channel="{ch["tvg_id"]}" group-title="{ch["group"]}",{ch["clean_name"]}'
@@ -184,12 +182,15 @@ def main():
     parser = argparse.ArgumentParser(description="Generate Vavoo Playlist for Streamlink (no proxy needed!)")
     parser.add_argument("--output", default="playlist_streamlink.m3u8", help="Output path for the playlist")
     parser.add_argument("--groups", nargs="+", default=["Italy"], help="Groups to include")
+    parser.add_argument("--network-caching", type=int, default=DEFAULT_NETWORK_CACHING_MS,
+                        help=f"VLC network-caching in ms (default: {DEFAULT_NETWORK_CACHING_MS})")
     
     args = parser.parse_args()
     
     success = generate_streamlink_playlist(
         output_path=args.output,
-        groups=args.groups
+        groups=args.groups,
+        network_caching=args.network_caching
     )
     
     sys.exit(0 if success else 1)
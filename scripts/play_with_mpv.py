@@ -15,6 +15,7 @@ import subprocess
 import argparse
 import logging
 import re
+from functools import lru_cache
 
 # Add the root directory to sys.path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
@@ -34,16 +35,38 @@ logger = logging.getLogger(__name__)
 # mpv path - can be customized
 MPV_PATH = r"C:\Users\mdeangelis\Downloads\mpv-x86_64\mpv.exe"
 
+# Cache/demuxer tuning for live IPTV: refill to a watermark before resuming
+# instead of pausing and resuming on every cache drain, and let ffmpeg
+# reconnect dropped HTTP streams.
+MPV_STREAM_ARGS = [
+    "--cache=yes",
+    "--demuxer-max-bytes=50MiB",
+    "--demuxer-readahead-secs=30",
+    "--cache-secs=30",
+    "--cache-pause-initial=yes",
+    "--cache-pause-wait=2",
+    "--stream-lavf-o=reconnect=1,reconnect_streamed=1,reconnect_delay_max=5",
+]
+
 # Playlist file path
 PLAYLIST_PATH = os.path.join(os.path.dirname(__file__), "..", "playlist.m3u8")
 
+# #EXTINF attribute patterns, compiled once
+_TVG_ID_RE = re.compile(r'tvg-id="([^"]*)"')
+_GROUP_TITLE_RE = re.compile(r'group-title="([^"]*)"')
 
-def check_mpv_installed():
-    """Check if mpv is installed."""
+
+@lru_cache(maxsize=None)
+def _probe_mpv():
+    """
+    Locate mpv once per process.
+    
+    Returns:
+        Tuple of (command, version line or None), or None if mpv is missing
+    """
     # First try the custom path
     if os.path.exists(MPV_PATH):
-        logger.info(f"mpv found at: {MPV_PATH}")
-        return True
+        return MPV_PATH, None
     
     # Then try system PATH
     try:
@@ -54,10 +77,22 @@ def check_mpv_installed():
             timeout=5
         )
         if result.returncode == 0:
-            logger.info(f"mpv found in PATH: {result.stdout.split(chr(10))[0]}")
-            return True
+            return "mpv", result.stdout.split(chr(10))[0]
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
+    return None
+
+
+def check_mpv_installed():
+    """Check if mpv is installed."""
+    probe = _probe_mpv()
+    if probe:
+        cmd, version = probe
+        if version is None:
+            logger.info(f"mpv found at: {cmd}")
+        else:
+            logger.info(f"mpv found in PATH: {version}")
+        return True
     
     logger.error("mpv not found!")
     logger.info(f"Expected at: {MPV_PATH}")
@@ -67,9 +102,13 @@ def check_mpv_installed():
 
 def get_mpv_command():
     """Get the mpv command (custom path or system)."""
-    if os.path.exists(MPV_PATH):
-        return MPV_PATH
-    return "mpv"
+    probe = _probe_mpv()
+    return probe[0] if probe else "mpv"
+
+
+def _build_mpv_cmd(*args):
+    """Build an mpv command line: binary, shared stream options, then args."""
+    return [get_mpv_command(), *MPV_STREAM_ARGS, *args]
 
 
 def parse_playlist(playlist_path):
@@ -86,37 +125,38 @@ def parse_playlist(playlist_path):
         logger.info("Generate it with: python generate_playlist.py")
         return channels
     
+    # Stream the file; only the pending #EXTINF entry is kept between lines
+    pending = None
     with open(playlist_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Look for #EXTINF lines
-        if line.startswith('#EXTINF:'):
-            # Parse channel info
-            match = re.search(r'tvg-id="([^"]*)"', line)
-            tvg_id = match.group(1) if match else ""
-            
-            match = re.search(r'group-title="([^"]*)"', line)
-            group = match.group(1) if match else ""
+        for raw in f:
+            line = raw.strip()
             
-            # Get channel name (after the last comma)
-            name = line.split(',')[-1].strip()
+            # The line after #EXTINF should be the URL
+            if pending is not None:
+                if line and not line.startswith('#'):
+                    pending['url'] = line
+                    channels.append(pending)
+                pending = None
+                continue
             
-            # Next line should be the URL
-            i += 1
-            if i < len(lines):
-                url = lines[i].strip()
-                if url and not url.startswith('#'):
-                    channels.append({
-                        'name': name,
-                        'url': url,
-                        'group': group,
-                        'tvg_id': tvg_id
-                    })
-        i += 1
+            # Look for #EXTINF lines
+            if line.startswith('#EXTINF:'):
+                # Parse channel info
+                match = _TVG_ID_RE.search(line)
+                tvg_id = match.group(1) if match else ""
+                
+                match = _GROUP_TITLE_RE.search(line)
+                group = match.group(1) if match else ""
+                
+                # Get channel name (after the last comma)
+                name = line.split(',')[-1].strip()
+                
+                pending = {
+                    'name': name,
+                    'url': None,
+                    'group': group,
+                    'tvg_id': tvg_id
+                }
     
     return channels
 
@@ -156,17 +196,16 @@ def find_channel(channel_name, playlist_path=None):
     
     channel_name_upper = channel_name.upper()
     
-    # Try exact match first
+    # Exact match wins; otherwise the first partial match (names upper-cased once)
+    partial = None
     for ch in channels:
-        if ch['name'].upper() == channel_name_upper:
+        name_upper = ch['name'].upper()
+        if name_upper == channel_name_upper:
             return ch
+        if partial is None and channel_name_upper in name_upper:
+            partial = ch
     
-    # Try partial match
-    for ch in channels:
-        if channel_name_upper in ch['name'].upper():
-            return ch
-    
-    return None
+    return partial
 
 
 def play_url(url, channel_name="Unknown"):
@@ -177,16 +216,7 @@ def play_url(url, channel_name="Unknown"):
         url: The stream URL (already authenticated)
         channel_name: Name of the channel (for display)
     """
-    mpv_cmd = get_mpv_command()
-    cmd = [
-        mpv_cmd,
-        "--http-header-fields",
-        "User-Agent: okhttp/4.11.0",
-        "--cache=yes",
-        "--demuxer-max-bytes=50MiB",
-        "--demuxer-readahead-secs=30",
-        url
-    ]
+    cmd = _build_mpv_cmd("--http-header-fields", "User-Agent: okhttp/4.11.0", url)
     
     logger.info(f"Starting mpv...")
     logger.info(f"Channel: {channel_name}")
@@ -234,15 +264,7 @@ def play_playlist(playlist_path=None):
         logger.info("Generate it with: python generate_playlist.py")
         return False
     
-    mpv_cmd = get_mpv_command()
-    cmd = [
-        mpv_cmd,
-        "--playlist",
-        playlist_path,
-        "--cache=yes",
-        "--demuxer-max-bytes=50MiB",
-        "--demuxer-readahead-secs=30"
-    ]
+    cmd = _build_mpv_cmd("--playlist", playlist_path)
     
     logger.info(f"Starting mpv with playlist...")
     logger.info(f"Playlist: {playlist_path}")
@@ -19,7 +19,7 @@ import logging
 # Add the root directory to sys.path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
-from src.playlist_generator import PlaylistGenerator
+from src.playlist_generator import PlaylistGenerator, DEFAULT_NETWORK_CACHING_MS
 
 # Configure logging
 logging.basicConfig(
@@ -73,16 +73,18 @@ def get_channel_url(channel_name, groups=None):
         logger.error("No channels fetched")
         return None, None
     
-    # Search for channel (case-insensitive partial match)
+    # Single pass: exact match wins, otherwise first case-insensitive partial match
     channel_name_upper = channel_name.upper()
+    partial = None
     for ch in channels:
-        if channel_name_upper in ch['name'].upper():
+        name_upper = ch['name'].upper()
+        if name_upper == channel_name_upper:
             return ch['url'], ch
+        if partial is None and channel_name_upper in name_upper:
+            partial = ch
     
-    # Try exact match
-    for ch in channels:
-        if ch['name'].upper() == channel_name_upper:
-            return ch['url'], ch
+    if partial is not None:
+        return partial['url'], partial
     
     return None, None
 
@@ -110,13 +112,14 @@ def list_channels(groups=None):
     print(f"\n{'='*60}")
 
 
-def play_stream(url, player="vlc"):
+def play_stream(url, player="vlc", network_caching=DEFAULT_NETWORK_CACHING_MS):
     """
     Play a stream URL using Streamlink.
     
     Args:
         url: The stream URL
         player: Player to use (vlc, mpv, etc.)
+        network_caching: VLC network-caching in ms (ignored for other players)
     """
     # Get fresh signature using PlaylistGenerator
     gen = PlaylistGenerator()
@@ -134,10 +137,11 @@ def play_stream(url, player="vlc"):
         "--player", player,
         "--http-header", f"mediahubmx-signature={sig}",
         "--http-header", "User-Agent=okhttp/4.11.0",
-        "--player-args", "--network-caching=3000",
-        url,
-        "best"
     ]
+    if "vlc" in os.path.basename(player).lower():
+        cmd += ["--player-args",
+                f"--network-caching={network_caching} --clock-jitter=0 --clock-synchro=0"]
+    cmd += [url, "best"]
     
     logger.info(f"Starting Streamlink with {player}...")
     logger.info(f"Command: {' '.join(cmd)}")
@@ -216,6 +220,8 @@ Examples:
     parser.add_argument("--player", default="vlc", help="Player to use (vlc, mpv, etc.)")
     parser.add_argument("--list", "-l", action="store_true", help="List available channels")
     parser.add_argument("--groups", nargs="+", default=["Italy"], help="Groups to include")
+    parser.add_argument("--network-caching", type=int, default=DEFAULT_NETWORK_CACHING_MS,
+                        help=f"VLC network-caching in ms (default: {DEFAULT_NETWORK_CACHING_MS})")
     
     args = parser.parse_args()
     
@@ -233,7 +239,7 @@ Examples:
         url, ch_info = get_channel_url(args.channel, args.groups)
         if url:
             logger.info(f"Found channel: {ch_info['name']}")
-            success = play_stream(url, args.player)
+            success = play_stream(url, args.player, args.network_caching)
             sys.exit(0 if success else 1)
         else:
             logger.error(f"Channel not found: {args.channel}")
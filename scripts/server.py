@@ -8,11 +8,13 @@ that VLC cannot provide natively (but Kodi can through addons).
 import os
 import sys
 import time
+import base64
 import logging
 import requests
 import urllib3
 from flask import Flask, Response, request, stream_with_context
 from threading import Lock
+from functools import lru_cache
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -25,6 +27,7 @@ from src.data_manager import DataManager
 USER_AGENT = "okhttp/4.11.0"
 API_BASE = "https://www.vavoo.tv/api"
 VAOO_URL = "https://vavoo.to/mediahubmx-catalog.json"
+PLAYLIST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'playlist_proxy.m3u8')
 
 # Configure logging
 logging.basicConfig(
@@ -51,6 +54,60 @@ _auth_cache = {
 }
 _auth_lock = Lock()
 
+# Static signature request, built once at import
+_AUTH_URL = f"{API_BASE}/addon/sig"
+_AUTH_HEADERS = {
+    "user-agent": USER_AGENT,
+    "accept": "application/json",
+    "content-type": "application/json; charset=utf-8"
+}
+
+_AUTH_PAYLOAD = {
+    "token": "tos",
+    "reason": "app",
+    "locale": "de",
+    "theme": "dark",
+    "metadata": {
+        "device": {
+            "type": "Android",
+            "name": "Pixel 8 Pro",
+            "osVersion": "14",
+            "appVersion": "3.1.20",
+            "language": "de",
+            "userAgent": USER_AGENT,
+            "screenResolution": "1440x2960",
+            "supportedTypes": ["dash", "hls"]
+        },
+        "addonVersion": "3.1.20",
+        "hasAddon": True,
+        "castConnected": False,
+        "package": "tv.vavoo.app",
+        "version": "3.1.20",
+        "process": "app",
+        "firstAppStart": 1743962904623,
+        "lastAppStart": 1743962904623,
+        "ipLocation": "",
+        "adblockEnabled": True,
+        "proxy": {"supported": ["ss", "openvpn"], "engine": "ss", "ssVersion": 1, "enabled": True, "autoServer": True, "id": "pl-waw"},
+        "iap": {"supported": False}
+    }
+}
+
+# Base headers for upstream stream requests
+_STREAM_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "*/*",
+    "Accept-Encoding": "identity",
+    "Connection": "keep-alive"
+}
+
+# Playlist content cache, refreshed when the file on disk changes
+_playlist_cache = {
+    "stamp": None,
+    "content": None
+}
+_playlist_lock = Lock()
+
 
 def get_auth_signature():
     """
@@ -62,47 +119,9 @@ def get_auth_signature():
         if _auth_cache["sig"] and (time.time() - _auth_cache["timestamp"] < 600):
             return _auth_cache["sig"]
         
-        url = f"{API_BASE}/addon/sig"
-        headers = {
-            "user-agent": USER_AGENT,
-            "accept": "application/json",
-            "content-type": "application/json; charset=utf-8"
-        }
-        
-        data = {
-            "token": "tos",
-            "reason": "app",
-            "locale": "de",
-            "theme": "dark",
-            "metadata": {
-                "device": {
-                    "type": "Android",
-                    "name": "Pixel 8 Pro",
-                    "osVersion": "14",
-                    "appVersion": "3.1.20",
-                    "language": "de",
-                    "userAgent": USER_AGENT,
-                    "screenResolution": "1440x2960",
-                    "supportedTypes": ["dash", "hls"]
-                },
-                "addonVersion": "3.1.20",
-                "hasAddon": True,
-                "castConnected": False,
-                "package": "tv.vavoo.app",
-                "version": "3.1.20",
-                "process": "app",
-                "firstAppStart": 1743962904623,
-                "lastAppStart": 1743962904623,
-                "ipLocation": "",
-                "adblockEnabled": True,
-                "proxy": {"supported": ["ss", "openvpn"], "engine": "ss", "ssVersion": 1, "enabled": True, "autoServer": True, "id": "pl-waw"},
-                "iap": {"supported": False}
-            }
-        }
-        
         try:
             logger.info("Requesting authentication signature...")
-            response = _http_session.post(url, json=data, headers=headers, timeout=10, verify=False)
+            response = _http_session.post(_AUTH_URL, json=_AUTH_PAYLOAD, headers=_AUTH_HEADERS, timeout=10, verify=False)
             response.raise_for_status()
             sig = response.json().get("addonSig")
             if sig:
@@ -116,6 +135,25 @@ def get_auth_signature():
         return None
 
 
+def load_playlist():
+    """
+    Return the playlist bytes, re-reading the file only when it changed.
+    Returns None if the playlist does not exist.
+    """
+    try:
+        st = os.stat(PLAYLIST_PATH)
+    except FileNotFoundError:
+        return None
+    
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _playlist_lock:
+        if _playlist_cache["stamp"] != stamp:
+            with open(PLAYLIST_PATH, 'rb') as f:
+                _playlist_cache["content"] = f.read()
+            _playlist_cache["stamp"] = stamp
+        return _playlist_cache["content"]
+
+
 def proxy_stream(url, headers=None):
     """
     Generator function to proxy stream content.
@@ -129,13 +167,7 @@ def proxy_stream(url, headers=None):
     """
     try:
         # Prepare headers for the upstream request
-        upstream_headers = {
-            "User-Agent": USER_AGENT,
-            "Accept": "*/*",
-            "Accept-Encoding": "identity",
-            "Connection": "keep-alive"
-        }
-        
+        upstream_headers = dict(_STREAM_HEADERS)
         if headers:
             upstream_headers.update(headers)
         
@@ -159,6 +191,25 @@ def proxy_stream(url, headers=None):
         raise
 
 
+@lru_cache(maxsize=1024)
+def decode_channel(channel_id):
+    """
+    Decode a proxy channel id into (original_url, content_type).
+    
+    The ids in the playlist never change for a channel, so the result is
+    memoized; players re-request the same channels when zapping.
+    """
+    original_url = base64.b64decode(channel_id).decode('utf-8')
+    
+    # Determine content type based on URL
+    content_type = 'video/mp2t'  # Default for MPEG-TS streams
+    if '.m3u8' in original_url:
+        content_type = 'application/vnd.apple.mpegurl'
+    elif '.mpd' in original_url:
+        content_type = 'application/dash+xml'
+    return original_url, content_type
+
+
 @app.route('/stream/<channel_id>')
 def stream_channel(channel_id):
     """
@@ -167,11 +218,9 @@ def stream_channel(channel_id):
     The channel_id is the base64-encoded original Vavoo URL.
     This endpoint adds the required authentication headers and proxies the stream.
     """
-    import base64
-    
     try:
         # Decode the original URL
-        original_url = base64.b64decode(channel_id).decode('utf-8')
+        original_url, content_type = decode_channel(channel_id)
         logger.info(f"Stream request for: {original_url[:100]}...")
         
         # Get authentication signature
@@ -188,13 +237,6 @@ def stream_channel(channel_id):
             "mediahubmx-signature": sig
         }
         
-        # Determine content type based on URL
-        content_type = 'video/mp2t'  # Default for MPEG-TS streams
-        if '.m3u8' in original_url:
-            content_type = 'application/vnd.apple.mpegurl'
-        elif '.mpd' in original_url:
-            content_type = 'application/dash+xml'
-        
         # Return streaming response
         return Response(
             stream_with_context(proxy_stream(original_url, headers)),
@@ -221,10 +263,8 @@ def serve_playlist():
     Serve the generated playlist with proxy URLs.
     """
     try:
-        playlist_path = os.path.join(os.path.dirname(__file__), 'playlist_proxy.m3u8')
-        if os.path.exists(playlist_path):
-            with open(playlist_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        content = load_playlist()
+        if content is not None:
             return Response(
                 content,
                 content_type='application/vnd.apple.mpegurl',
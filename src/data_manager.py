@@ -16,6 +16,15 @@ from typing import Optional, Dict, List, Tuple, Any
 # Import optimized EPG manager
 from src.epg_manager import EPGManager, EPGSource, load_epg_data
 
+# Precompiled patterns for name normalization and logo matching
+_NON_ALNUM_RE = re.compile(r'[^A-Z0-9]')
+_IT_SUFFIX_RE = re.compile(r'IT$')
+_EPG_PREFIX_RE = re.compile(r'^(IT|CH)\s*-\s*', re.IGNORECASE)
+_EXTENSION_RE = re.compile(r'\s+\.[A-Z]{1,3}$')
+_VAVOO_SUFFIX_RE = re.compile(r'\s+[CST]$')
+_BRACKETS_RE = re.compile(r'\[.*?\]')
+_PARENS_RE = re.compile(r'\(.*?\)')
+_QUALITY_RE = re.compile(r'\s+(HD|FHD|SD|HEVC|H265).*')
 
 class DataManager:
     """
@@ -56,8 +65,8 @@ class DataManager:
         for filename in os.listdir(logos_dir):
             if filename.endswith(('.png', '.svg', '.jpg')):
                 base = os.path.splitext(filename)[0]
-                norm_base = re.sub(r'[^A-Z0-9]', '', base.upper())
-                norm_base = re.sub(r'IT$', '', norm_base)
+                norm_base = _NON_ALNUM_RE.sub('', base.upper())
+                norm_base = _IT_SUFFIX_RE.sub('', norm_base)
                 self.logos_map[norm_base] = os.path.join(logos_dir, filename)
         
         # Pre-sort keys by length (longer first) for better partial matching
@@ -68,7 +77,7 @@ class DataManager:
         if not norm_name:
             return None
         
-        snorm = re.sub(r'[^A-Z0-9]', '', norm_name)
+        snorm = _NON_ALNUM_RE.sub('', norm_name)
         if snorm in self.logos_map:
             return self.logos_map[snorm]
         
@@ -88,7 +97,7 @@ class DataManager:
             return None
         
         # Remove "IT - " or "CH - " prefix if present
-        clean_name = re.sub(r'^(IT|CH)\s*-\s*', '', raw_name, flags=re.IGNORECASE)
+        clean_name = _EPG_PREFIX_RE.sub('', raw_name)
         return clean_name.strip()
 
     def normalize_name(self, name: str) -> str:
@@ -103,20 +112,20 @@ class DataManager:
         n = name.upper().strip()
         
         # Remove explicit country codes or extensions
-        n = re.sub(r'\s+\.[A-Z]{1,3}$', '', n)
+        n = _EXTENSION_RE.sub('', n)
         
         # Remove Vavoo specific suffixes
-        n = re.sub(r'\s+[CST]$', '', n)
+        n = _VAVOO_SUFFIX_RE.sub('', n)
         
         # Remove parentheses/brackets
-        n = re.sub(r'\[.*?\]', '', n)
-        n = re.sub(r'\(.*?\)', '', n)
+        n = _BRACKETS_RE.sub('', n)
+        n = _PARENS_RE.sub('', n)
         
         # Remove quality suffixes
-        n = re.sub(r'\s+(HD|FHD|SD|HEVC|H265).*', '', n)
+        n = _QUALITY_RE.sub('', n)
         
         # Remove special chars AND spaces
-        n = re.sub(r'[^A-Z0-9]', '', n)
+        n = _NON_ALNUM_RE.sub('', n)
         
         result = n.strip()
         self._normalize_cache[name] = result
@@ -214,17 +223,22 @@ class DataManager:
         return datetime.now(ZoneInfo("Europe/Rome"))
 
     def get_current_program(self, channel_id: str, 
-                            norm_name: str = None) -> Tuple[Optional[str], Optional[str], Optional[datetime], Optional[datetime]]:
+                            norm_name: str = None,
+                            now: Optional[datetime] = None) -> Tuple[Optional[str], Optional[str], Optional[datetime], Optional[datetime]]:
         """Finds the current running program using ID or normalized name.
         
+        Pass ``now`` when querying many channels at once to read the clock once.
+        
         Returns: (title, desc, start_dt, stop_dt)
         """
+        if now is None:
+            now = datetime.now(timezone.utc)
+        
         # Use optimized EPG manager if available
         if self._epg_manager:
-            return self._epg_manager.get_current_program(channel_id, norm_name)
+            return self._epg_manager.get_current_program(channel_id, norm_name, now)
         
         # Fallback to legacy implementation
-        now = datetime.now(timezone.utc)
         target_id = channel_id
         
         if target_id not in self.epg_data and norm_name:
@@ -21,6 +21,7 @@ import hashlib
 import io
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, List, Tuple, Set
 from dataclasses import dataclass, field
 import urllib3
@@ -28,6 +29,11 @@ import urllib3
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Precompiled patterns for EPGParser.normalize_name
+_EPG_PREFIX_RE = re.compile(r'^(IT|CH)\s*-\s*', re.IGNORECASE)
+_EPG_QUALITY_RE = re.compile(r'\s+(HD|FHD|SD|HEVC|H265|4K).*')
+_NON_ALNUM_RE = re.compile(r'[^A-Z0-9]')
+
 
 @dataclass
 class EPGSource:
@@ -228,13 +234,13 @@ class EPGParser:
         n = name.upper().strip()
         
         # Remove country prefixes
-        n = re.sub(r'^(IT|CH)\s*-\s*', '', n, flags=re.IGNORECASE)
+        n = _EPG_PREFIX_RE.sub('', n)
         
         # Remove quality suffixes
-        n = re.sub(r'\s+(HD|FHD|SD|HEVC|H265|4K).*', '', n)
+        n = _EPG_QUALITY_RE.sub('', n)
         
         # Remove special chars
-        n = re.sub(r'[^A-Z0-9]', '', n)
+        n = _NON_ALNUM_RE.sub('', n)
         
         return n.strip()
     
@@ -267,6 +273,11 @@ class EPGParser:
         now = datetime.now(timezone.utc)
         cutoff = now + timedelta(hours=self.PROGRAM_WINDOW_HOURS)
         
+        # Hoist per-element lookups out of the parse loop
+        parse_date = self.parse_xmltv_date
+        normalize = self.normalize_name
+        rsi_only = "Swiss" in source_name or "RSI" in source_name
+        
         try:
             # Use iterparse for memory efficiency
             context = ET.iterparse(io.BytesIO(xml_content), events=('start', 'end'))
@@ -284,12 +295,12 @@ class EPGParser:
                     display_name_elem = elem.find('display-name')
                     display_name = display_name_elem.text if display_name_elem is not None else ""
                     
+                    norm = normalize(display_name)
+                    
                     # Filter Swiss channels (RSI only)
-                    if "Swiss" in source_name or "RSI" in source_name:
-                        norm = self.normalize_name(display_name)
-                        if norm not in ["RSILA1", "RSILA2"]:
-                            elem.clear()
-                            continue
+                    if rsi_only and norm not in ("RSILA1", "RSILA2"):
+                        elem.clear()
+                        continue
                     
                     icon_elem = elem.find('icon')
                     icon = icon_elem.get('src') if icon_elem is not None else None
@@ -298,7 +309,7 @@ class EPGParser:
                         id=channel_id,
                         display_name=display_name,
                         icon=icon,
-                        normalized_name=self.normalize_name(display_name)
+                        normalized_name=norm
                     )
                     
                 elif elem.tag == 'programme':
@@ -310,8 +321,8 @@ class EPGParser:
                         elem.clear()
                         continue
                     
-                    start_dt = self.parse_xmltv_date(start_str)
-                    stop_dt = self.parse_xmltv_date(stop_str)
+                    start_dt = parse_date(start_str)
+                    stop_dt = parse_date(stop_str)
                     
                     if not start_dt or not stop_dt:
                         elem.clear()
@@ -341,9 +352,10 @@ class EPGParser:
                         desc=desc or ""
                     )
                     
-                    if channel_id not in programs:
-                        programs[channel_id] = []
-                    programs[channel_id].append(prog)
+                    channel_programs = programs.get(channel_id)
+                    if channel_programs is None:
+                        channel_programs = programs[channel_id] = []
+                    channel_programs.append(prog)
                 
                 # Clear element to free memory
                 elem.clear()
@@ -358,6 +370,8 @@ class EPGParser:
 class EPGManager:
     """Main EPG management class combining all components."""
     
+    MAX_WORKERS = 8  # parallel source downloads
+    
     DEFAULT_SOURCES = [
         EPGSource(
             name="Italy",
@@ -395,19 +409,28 @@ class EPGManager:
             True if at least one source loaded successfully.
         """
         success = False
+        sources = [s for s in self.sources if s.enabled]
         
-        for source in self.sources:
-            if not source.enabled:
-                continue
-                
-            if self._load_source(source, force_refresh):
-                success = True
+        # Download + parse sources in parallel, merge in source order
+        if sources:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(sources))) as executor:
+                results = list(executor.map(lambda s: self._load_source(s, force_refresh), sources))
+            
+            for result in results:
+                if result is not None:
+                    self._merge(*result)
+                    success = True
                 
         self._build_name_index()
         return success
     
-    def _load_source(self, source: EPGSource, force_refresh: bool) -> bool:
-        """Load a single EPG source."""
+    def _load_source(self, source: EPGSource,
+                     force_refresh: bool) -> Optional[Tuple[Dict[str, ChannelInfo], Dict[str, List[Program]]]]:
+        """Load and parse a single EPG source (safe to run in a worker thread).
+        
+        Returns:
+            Parsed (channels, programs), or None if the source failed.
+        """
         xml_content: Optional[bytes] = None
         
         # Try cache first
@@ -426,19 +449,17 @@ class EPGManager:
         
         if xml_content is None:
             logging.error(f"Failed to load EPG for {source.name}")
-            return False
-        
-        # Parse and merge
-        channels, programs = self.parser.parse(xml_content, source.name)
+            return None
         
-        # Merge into main storage
+        return self.parser.parse(xml_content, source.name)
+    
+    def _merge(self, channels: Dict[str, ChannelInfo], programs: Dict[str, List[Program]]):
+        """Merge one parsed source into main storage."""
         self.channels.update(channels)
         for ch_id, progs in programs.items():
             if ch_id not in self.programs:
                 self.programs[ch_id] = []
             self.programs[ch_id].extend(progs)
-        
-        return True
     
     def _build_name_index(self):
         """Build index for name-based lookups."""
@@ -455,13 +476,19 @@ class EPGManager:
         return None
     
     def get_current_program(self, channel_id: str, 
-                            norm_name: Optional[str] = None) -> Tuple[Optional[str], Optional[str], Optional[datetime], Optional[datetime]]:
+                            norm_name: Optional[str] = None,
+                            now: Optional[datetime] = None) -> Tuple[Optional[str], Optional[str], Optional[datetime], Optional[datetime]]:
         """Get current program for a channel.
         
+        Args:
+            now: Reference time (tz-aware). Pass it in when looking up many
+                channels in a row so the clock is read only once.
+        
         Returns:
             Tuple of (title, description, start, stop)
         """
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         
         # Try to find channel ID from name if not found
         if channel_id not in self.programs and norm_name:
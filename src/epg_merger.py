@@ -82,49 +82,52 @@ def merge_epg(output_path: str) -> bool:
             logging.warning(f"Skipping {source.name} — download failed")
             continue
 
+        # Stream the document and keep only the elements we need; channels
+        # and programmes for other IDs are cleared as soon as they are read.
+        source_channels: Dict[str, ET.Element] = {}
+        source_programmes: Dict[Tuple[str, str], ET.Element] = {}
         try:
-            tree = ET.parse(io.BytesIO(xml_content))
-            root = tree.getroot()
+            context = ET.iterparse(io.BytesIO(xml_content), events=("start", "end"))
+            _, root = next(context)
+            for event, elem in context:
+                if event != "end":
+                    continue
+                if elem.tag == "channel":
+                    ch_id = elem.get("id")
+                    # Only keep channels that are in our playlist's EPG_MAP
+                    if ch_id and ch_id in PLAYLIST_CHANNEL_IDS:
+                        source_channels.setdefault(ch_id, elem)
+                    else:
+                        elem.clear()
+                elif elem.tag == "programme":
+                    ch_id = elem.get("channel", "")
+                    start = elem.get("start", "")
+                    if ch_id and start and ch_id in PLAYLIST_CHANNEL_IDS:
+                        source_programmes.setdefault((ch_id, start), elem)
+                    else:
+                        elem.clear()
+                else:
+                    continue
+                root.clear()
         except ET.ParseError as e:
             logging.error(f"Failed to parse {source.name}: {e}")
             continue
 
-        source_channels = 0
-        source_programmes = 0
-
-        # Process channels — only keep those in our playlist
-        for ch_elem in root.findall("channel"):
-            ch_id = ch_elem.get("id")
-            if not ch_id:
-                continue
-
-            # Only keep channels that are in our playlist's EPG_MAP
-            if ch_id not in PLAYLIST_CHANNEL_IDS:
-                continue
-
+        # Earlier sources win; deduplicate programmes by (channel_id, start)
+        source_channel_count = 0
+        for ch_id, ch_elem in source_channels.items():
             if ch_id not in merged_channels:
                 merged_channels[ch_id] = ch_elem
-                source_channels += 1
-
-        # Process programmes — only keep those for our playlist channels
-        for prog_elem in root.findall("programme"):
-            ch_id = prog_elem.get("channel", "")
-            start = prog_elem.get("start", "")
+                source_channel_count += 1
 
-            if not ch_id or not start:
-                continue
-
-            if ch_id not in PLAYLIST_CHANNEL_IDS:
-                continue
-
-            # Deduplicate by (channel_id, start)
-            key = (ch_id, start)
+        source_programme_count = 0
+        for key, prog_elem in source_programmes.items():
             if key not in merged_programmes:
                 merged_programmes[key] = prog_elem
-                source_programmes += 1
+                source_programme_count += 1
 
         sources_loaded += 1
-        logging.info(f"  {source.name}: +{source_channels} channels, +{source_programmes} programmes")
+        logging.info(f"  {source.name}: +{source_channel_count} channels, +{source_programme_count} programmes")
 
     if sources_loaded == 0:
         logging.error("No EPG sources loaded!")
@@ -136,11 +139,8 @@ def merge_epg(output_path: str) -> bool:
     out_root = ET.Element("tv")
     out_root.set("generator-info-name", "vavoo-epg-merger")
 
-    for ch_id in sorted(merged_channels.keys()):
-        out_root.append(merged_channels[ch_id])
-
-    for key in sorted(merged_programmes.keys()):
-        out_root.append(merged_programmes[key])
+    out_root.extend(merged_channels[ch_id] for ch_id in sorted(merged_channels))
+    out_root.extend(merged_programmes[key] for key in sorted(merged_programmes))
 
     tree = ET.ElementTree(out_root)
     ET.indent(tree, space="  ")
@@ -18,9 +18,10 @@ import logging
 import os
 import re
 import sys
+import threading
 import time
 import urllib3
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from pathlib import Path
@@ -34,6 +35,19 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 CONFIG_PATH = Path(__file__).parent / "config.json"
 
+# VLC prebuffer for live streams, in ms (#EXTVLCOPT:network-caching). Lower
+# means faster channel zapping; values below ~500 ms can stall on some providers.
+DEFAULT_NETWORK_CACHING_MS = 1500
+
+# Precompiled patterns for channel name normalization
+_BRACKETS_RE = re.compile(r"\[.*?\]")
+_PARENS_RE = re.compile(r"\(.*?\)")
+_QUALITY_SUFFIX_RE = re.compile(r"\s+(HD|FHD|SD|4K|ITA|ITALIA|BACKUP|TIMVISION|PLUS)$")
+_ALNUM_EXTENSION_RE = re.compile(r"\s+\.[A-Z0-9]{1,3}$")
+_PLUS_SUFFIX_RE = re.compile(r"\s\+$")
+_NON_ALNUM_SPACE_RE = re.compile(r"[^A-Z0-9 ]")
+_SPACES_RE = re.compile(r"\s+")
+
 
 def load_config(path: Optional[Path] = None) -> Dict[str, Any]:
     """Load configuration from JSON file with fallback defaults."""
@@ -76,21 +90,8 @@ class PlaylistGenerator:
         self._output_cfg = self.config.get("output", {})
         self._catchup_cfg = self._output_cfg.get("catchup", {})
         self._auth_cache: Dict[str, Any] = {"sig": None, "timestamp": 0}
-        self.dm = DataManager()
-        self._logos_cache: Optional[Dict[str, str]] = None
-        self._session = self._create_session()
-        self._stats: Dict[str, Any] = {
-            "fetched": 0,
-            "deduplicated": 0,
-            "blacklisted": 0,
-            "renamed": 0,
-            "epg_matched": 0,
-            "logo_resolved": 0,
-            "channels_written": 0,
-            "categories": {},
-        }
-        self._auth_cache: Dict[str, Any] = {"sig": None, "timestamp": 0}
-        self.dm = DataManager()
+        self._dm: Optional[DataManager] = None
+        self._epg_future: Optional["Future[bool]"] = None
         self._logos_cache: Optional[Dict[str, str]] = None
         self._session = self._create_session()
         self._stats: Dict[str, Any] = {
@@ -104,6 +105,54 @@ class PlaylistGenerator:
             "categories": {},
         }
 
+    @property
+    def dm(self) -> DataManager:
+        """DataManager instance, created on first use (logo scan + EPG state)."""
+        if self._dm is None:
+            self._dm = DataManager()
+        return self._dm
+
+    def _start_epg_load(self) -> None:
+        """Start loading EPG data in the background so it overlaps the channel fetch.
+
+        Runs on a daemon thread: if generation is abandoned early the process
+        can exit without waiting for the EPG download.
+        """
+        if self._epg_future is not None and not self._epg_future.done():
+            return  # a load from an abandoned run is still in flight; reuse it
+        future: "Future[bool]" = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self.dm.load_all_epgs())
+            except Exception as e:
+                future.set_exception(e)
+
+        self._epg_future = future
+        threading.Thread(target=run, name="epg", daemon=True).start()
+
+    def _discard_epg_load(self) -> None:
+        """Drop a background EPG load whose result is no longer needed.
+
+        A load that is already running is kept so the next run reuses it
+        instead of starting a second one on the same DataManager.
+        """
+        if self._epg_future is not None and self._epg_future.cancel():
+            self._epg_future = None
+
+    def _wait_for_epg(self) -> bool:
+        """Block until EPG data is loaded, loading it now if no background load was started."""
+        future, self._epg_future = self._epg_future, None
+        if future is None:
+            return self.dm.load_all_epgs()
+        try:
+            return future.result()
+        except Exception as e:
+            logging.error(f"Background EPG load failed: {e}")
+            return False
+
     def _create_session(self) -> requests.Session:
         """Create a reusable HTTP session with connection pooling."""
         session = requests.Session()
@@ -186,26 +235,28 @@ class PlaylistGenerator:
         client_version = self._api_cfg.get("client_version", "3.0.2")
         catalog_url = self._api_cfg.get("catalog_url", "https://vavoo.to/mediahubmx-catalog.json")
 
-        while True:
-            data = {
-                "language": "en",
-                "region": "US",
-                "catalogId": "iptv",
-                "id": "iptv",
-                "adult": False,
-                "search": "",
-                "sort": "name",
-                "filter": {"group": group},
-                "cursor": cursor,
-                "clientVersion": client_version,
-            }
-            headers = {
-                "user-agent": self._api_cfg.get("user_agent", "okhttp/4.11.0"),
-                "accept": "application/json",
-                "content-type": "application/json; charset=utf-8",
-                "mediahubmx-signature": sig,
-            }
+        # Only the cursor changes between pages
+        data = {
+            "language": "en",
+            "region": "US",
+            "catalogId": "iptv",
+            "id": "iptv",
+            "adult": False,
+            "search": "",
+            "sort": "name",
+            "filter": {"group": group},
+            "cursor": cursor,
+            "clientVersion": client_version,
+        }
+        headers = {
+            "user-agent": self._api_cfg.get("user_agent", "okhttp/4.11.0"),
+            "accept": "application/json",
+            "content-type": "application/json; charset=utf-8",
+            "mediahubmx-signature": sig,
+        }
 
+        while True:
+            data["cursor"] = cursor
             try:
                 r = self._session.post(catalog_url, json=data, headers=headers, timeout=timeout, verify=False)
                 r.raise_for_status()
@@ -287,34 +338,36 @@ class PlaylistGenerator:
         client_version = self._api_cfg.get("client_version", "3.0.2")
         catalog_url = self._api_cfg.get("catalog_url", "https://vavoo.to/mediahubmx-catalog.json")
 
+        target_names = [tn.upper() for tn in target_names]
+
         found = []
         seen_urls: Set[str] = set()
+        headers = {
+            "user-agent": self._api_cfg.get("user_agent", "okhttp/4.11.0"),
+            "accept": "application/json",
+            "content-type": "application/json; charset=utf-8",
+            "mediahubmx-signature": sig,
+        }
 
         logging.info("Attempting targeted search for RSI channels...")
 
         for group in search_groups:
             for query in search_queries:
                 cursor = 0
+                data = {
+                    "language": "en",
+                    "region": "US",
+                    "catalogId": "iptv",
+                    "id": "iptv",
+                    "adult": False,
+                    "search": query,
+                    "sort": "name",
+                    "filter": {"group": group},
+                    "cursor": cursor,
+                    "clientVersion": client_version,
+                }
                 while True:
-                    data = {
-                        "language": "en",
-                        "region": "US",
-                        "catalogId": "iptv",
-                        "id": "iptv",
-                        "adult": False,
-                        "search": query,
-                        "sort": "name",
-                        "filter": {"group": group},
-                        "cursor": cursor,
-                        "clientVersion": client_version,
-                    }
-                    headers = {
-                        "user-agent": self._api_cfg.get("user_agent", "okhttp/4.11.0"),
-                        "accept": "application/json",
-                        "content-type": "application/json; charset=utf-8",
-                        "mediahubmx-signature": sig,
-                    }
-
+                    data["cursor"] = cursor
                     try:
                         r = self._session.post(catalog_url, json=data, headers=headers, timeout=timeout, verify=False)
                         if r.status_code == 200:
@@ -329,7 +382,7 @@ class PlaylistGenerator:
 
                                 if url and url not in seen_urls:
                                     clean_name_up = name.upper()
-                                    if any(tn.upper() in clean_name_up for tn in target_names):
+                                    if any(tn in clean_name_up for tn in target_names):
                                         found.append({
                                             "name": name,
                                             "url": url,
@@ -363,15 +416,15 @@ class PlaylistGenerator:
         if not name:
             return ""
         n = name.upper()
-        n = re.sub(r"\[.*?\]", "", n)
-        n = re.sub(r"\(.*?\)", "", n)
-        n = re.sub(r"\s+(HD|FHD|SD|4K|ITA|ITALIA|BACKUP|TIMVISION|PLUS)$", "", n)
+        n = _BRACKETS_RE.sub("", n)
+        n = _PARENS_RE.sub("", n)
+        n = _QUALITY_SUFFIX_RE.sub("", n)
 
         if not n.startswith("HISTORY"):
-            n = re.sub(r"\s+\.[A-Z0-9]{1,3}$", "", n)
-        n = re.sub(r"\s\+$", "", n)
-        n = re.sub(r"[^A-Z0-9 ]", "", n)
-        n = re.sub(r"\s+", " ", n)
+            n = _ALNUM_EXTENSION_RE.sub("", n)
+        n = _PLUS_SUFFIX_RE.sub("", n)
+        n = _NON_ALNUM_SPACE_RE.sub("", n)
+        n = _SPACES_RE.sub(" ", n)
         return n.strip()
 
     def _fuzzy_match_epg(self, norm_name: str, epg_map: Dict[str, str], threshold: float = 0.85) -> Optional[str]:
@@ -386,7 +439,7 @@ class PlaylistGenerator:
                 best_match = epg_map[key]
 
         if best_match:
-            logging.debug(f"Fuzzy matched '{norm_name}' -> '{best_match}' (score: {best_score:.2f})")
+            logging.debug("Fuzzy matched '%s' -> '%s' (score: %.2f)", norm_name, best_match, best_score)
         return best_match
 
     def _get_categories(self, norm_name: str) -> List[str]:
@@ -483,7 +536,8 @@ class PlaylistGenerator:
         no_epg_channels = set(self.config.get("no_epg_channels", []))
 
         logging.info("Loading EPG data for name resolution...")
-        self.dm.load_all_epgs()
+        if not self._wait_for_epg():
+            logging.warning("EPG data unavailable, continuing without EPG names")
 
         for ch in channels:
             norm_name = self._normalize_name(ch["name"])
@@ -569,11 +623,13 @@ class PlaylistGenerator:
             except OSError as e:
                 logging.warning(f"Error deleting existing playlist: {e}")
 
+        self._start_epg_load()
         channels = self.fetch_all_channels(groups)
         logging.info(f"DEBUG: fetch_all_channels returned {len(channels)} items.")
 
         if not channels:
             logging.warning("No channels found to write.")
+            self._discard_epg_load()
             return False
 
         processed = self.process_channels(channels)
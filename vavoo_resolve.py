@@ -12,6 +12,9 @@ import os
 AUTH_API = "https://www.lokke.app/api/app/ping"
 RESOLVE_API = "https://vavoo.to/mediahubmx-resolve.json"
 MPV_PATH = r"C:\Users\mdeangelis\Downloads\mpv-x86_64\mpv.exe"
+MPV_ARGS = ["--user-agent=okhttp/4.11.0", "--cache=yes", "--demuxer-max-bytes=50MiB", "--demuxer-readahead-secs=30",
+            "--cache-secs=30", "--cache-pause-initial=yes", "--cache-pause-wait=2",
+            "--stream-lavf-o=reconnect=1,reconnect_streamed=1,reconnect_delay_max=5"]
 
 _auth_cache = {"sig": None, "ts": 0}
 
@@ -43,7 +46,7 @@ if __name__ == "__main__":
     try:
         stream_url = resolve(play_url)
         mpv = MPV_PATH if os.path.exists(MPV_PATH) else "mpv"
-        subprocess.run([mpv, "--user-agent=okhttp/4.11.0", "--cache=yes", "--demuxer-max-bytes=50MiB", "--demuxer-readahead-secs=30", stream_url])
+        subprocess.run([mpv, *MPV_ARGS, stream_url])
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
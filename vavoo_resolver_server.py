@@ -5,7 +5,7 @@
 import time
 import threading
 import requests
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import quote, unquote, parse_qs, urlparse
 
 AUTH_API = "https://www.lokke.app/api/app/ping"
@@ -65,7 +65,7 @@ class Handler(BaseHTTPRequestHandler):
         pass
 
 def start_server(port):
-    server = HTTPServer(("127.0.0.1", port), Handler)
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
     t = threading.Thread(target=server.serve_forever, daemon=True)
     t.start()
     return server
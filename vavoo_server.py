@@ -8,14 +8,18 @@ import sys
 import time
 import threading
 import requests
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from collections import OrderedDict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import quote, unquote, parse_qs, urlparse
 
 AUTH_API = "https://www.lokke.app/api/app/ping"
 RESOLVE_API = "https://vavoo.to/mediahubmx-resolve.json"
 PORT = 18920
+RESOLVE_CACHE_SIZE = 8   # ultimi canali risolti (zapping avanti/indietro)
+RESOLVE_TTL = 60         # secondi di validità di un URL risolto
 
 _auth_cache = {"sig": None, "ts": 0}
+_resolve_cache = OrderedDict()
 _lock = threading.Lock()
 
 def get_sig():
@@ -36,9 +40,20 @@ def get_sig():
     return sig
 
 def resolve(play_url):
+    with _lock:
+        hit = _resolve_cache.get(play_url)
+        if hit and (time.time() - hit[1] < RESOLVE_TTL):
+            _resolve_cache.move_to_end(play_url)
+            return hit[0]
     sig = get_sig()
     r = requests.post(RESOLVE_API, json={"language": "de", "region": "AT", "url": play_url, "clientVersion": "3.0.2"}, headers={"user-agent": "MediaHubMX/2", "accept": "application/json", "content-type": "application/json; charset=utf-8", "content-length": "115", "accept-encoding": "gzip", "mediahubmx-signature": sig}, timeout=10)
-    return r.json()[0]["url"]
+    stream_url = r.json()[0]["url"]
+    with _lock:
+        _resolve_cache[play_url] = (stream_url, time.time())
+        _resolve_cache.move_to_end(play_url)
+        while len(_resolve_cache) > RESOLVE_CACHE_SIZE:
+            _resolve_cache.popitem(last=False)
+    return stream_url
 
 class Handler(BaseHTTPRequestHandler):
     def do_GET(self):
@@ -86,7 +101,7 @@ def generate_playlist(channels, port):
     return "".join(lines)
 
 def start_server(port):
-    server = HTTPServer(("127.0.0.1", port), Handler)
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
     t = threading.Thread(target=server.serve_forever, daemon=True)
     t.start()
     return server